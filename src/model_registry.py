@@ -1,4 +1,7 @@
 # model_registry.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import mlflow
 from mlflow.tracking.client import MlflowClient
 
@@ -12,17 +15,23 @@ class Singleton(type):
     """
 
     _instances = {}
+    _lock = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
         """
         Checks if an instance already exists.
         If not, creates a new one and stores it in the _instances dictionary.
+        Creation is guarded by a lock so concurrent callers share one instance.
 
         Returns:
             The unique instance of the class.
         """
         if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+            with cls._lock:
+                if cls not in cls._instances:
+                    cls._instances[cls] = super(Singleton, cls).__call__(
+                        *args, **kwargs
+                    )
         return cls._instances[cls]
 
 
@@ -32,14 +41,82 @@ class ModelRegistryManager(metaclass=Singleton):
 
     Uses the Singleton metaclass to ensure that only one instance
     of the MLflowClient connection is used throughout the pipeline execution.
+    The client reuses MLflow's pooled HTTP session, so it can be shared across
+    worker threads. Timeouts and retries with backoff (connection errors,
+    429 and 5xx responses) are handled by that session and configured through
+    the `MLFLOW_HTTP_REQUEST_*` environment variables at the entry point
+    (see `water_scan_main.main`).
     """
 
-    def __init__(self):
+    def __init__(self, max_workers: int = 4):
         """
         Initializes the client for communication with the MLflow Tracking Server.
+
+        Only the first construction counts: as a Singleton, arguments passed on
+        later calls are ignored.
+
+        Args:
+            max_workers (int, optional): Threads used by `register_and_transition_many`.
+                Kept below the HTTP connection pool size (10). Default: 4.
         """
+        self.max_workers = max_workers
         self.client = MlflowClient()
 
+    def _find_version(self, model_name: str, run_id: str):
+        """
+        Looks up a version of the model already created from the given run.
+
+        Args:
+            model_name (str): Name of the model in the registry.
+            run_id (str): ID of the run that logged the model.
+
+        Returns:
+            ModelVersion | None: Latest matching version, or None if there is none.
+        """
+        versions = self.client.search_model_versions(
+            f"name='{model_name}' and run_id='{run_id}'"
+        )
+        if not versions:
+            return None
+        return max(versions, key=lambda version: int(version.version))
+
+    def _register_version(self, model_uri: str, model_name: str):
+        """
+        Creates a model version, reusing one already created from the same run.
+
+        `mlflow.register_model` is not idempotent: a request that timed out may
+        still have created the version. For "runs:/" URIs, a version created
+        from the same run is looked up first, so registering the run again
+        does not add a duplicate.
+
+        Args:
+            model_uri (str): URI of the saved model (e.g., "runs:/<run_id>/model_name").
+            model_name (str): Unique name for the model in the registry.
+
+        Returns:
+            ModelVersion: The created (or previously created) version.
+        """
+        if model_uri.startswith('runs:/'):
+            run_id = model_uri[len('runs:/') :].split('/')[0]
+            existing = self._find_version(model_name, run_id)
+            if existing is not None:
+                return existing
+        return mlflow.register_model(model_uri=model_uri, name=model_name)
+
+    @staticmethod
+    def build_model_uri(run_id: str, artifact_path: str = 'random_forest') -> str:
+        """
+        Builds the URI of a model logged in a given run.
+
+        Args:
+            run_id (str): ID of the MLflow run that logged the model.
+            artifact_path (str, optional): Artifact path of the model. Default: "random_forest".
+
+        Returns:
+            str: Model URI (e.g., "runs:/<run_id>/random_forest").
+        """
+        return f'runs:/{run_id}/{artifact_path}'
+
     def register_and_transition(
         self,
         model_uri: str,
@@ -59,8 +136,11 @@ class ModelRegistryManager(metaclass=Singleton):
         Returns:
             model_details: Object containing information about the registered version.
         """
-        model_details = mlflow.register_model(model_uri=model_uri, name=model_name)
-        self.client.update_registered_model(name=model_name, description=description)
+        model_details = self._register_version(model_uri, model_name)
+        self.client.update_registered_model(
+            name=model_name,
+            description=description,
+        )
         self.client.update_model_version(
             name=model_name,
             version=model_details.version,
@@ -76,3 +156,42 @@ class ModelRegistryManager(metaclass=Singleton):
             f"✅ Model '{model_name}' (version {model_details.version}) promoted to '{transition_stage}'."
         )
         return model_details
+
+    def register_and_transition_many(self, models: list[dict]):
+        """
+        Registers and transitions several models concurrently and waits for all of them.
+
+        Each model is processed by `register_and_transition` in a worker thread;
+        the calls of a single model stay sequential since each depends on the
+        version created by the previous one. A failure does not stop or roll
+        back the other models: they are still promoted (archiving their
+        previous versions in that stage), so callers must check each outcome.
+
+        Args:
+            models (list[dict]): Keyword arguments for `register_and_transition`,
+                one dict per model (keys: model_uri, model_name, description
+                and, optionally, transition_stage).
+
+        Returns:
+            list[tuple[str, ModelVersion | Exception]]: One (model_name, outcome)
+            pair per model, in the same order as `models`; the outcome is the
+            promoted version or the exception raised for that model.
+
+        Raises:
+            ValueError: If two entries share the same model_name, since their
+                concurrent transitions would archive each other's version.
+        """
+        names = [model['model_name'] for model in models]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f'Duplicate model names in batch: {duplicates}')
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.register_and_transition, **model)
+                for model in models
+            ]
+        return [
+            (name, future.exception() or future.result())
+            for name, future in zip(names, futures)
+        ]
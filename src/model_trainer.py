@@ -134,7 +134,8 @@ class RandomForestTrainer:
             best_params (dict): Dictionary containing the best hyperparameters.
 
         Returns:
-            Tuple[sklearn model, float, mlflow.models.signature]: Model, final accuracy, and model signature.
+            Tuple[sklearn model, float, mlflow.models.signature, str]: Model, final accuracy,
+            model signature, and ID of the run that logged the model (None if logging failed).
         """
         model = RandomForestClassifier(**best_params, random_state=42)
         model.fit(self.X_train, self.y_train)
@@ -162,10 +163,11 @@ class RandomForestTrainer:
         input_example = self.X_train.iloc[:1]
         signature = infer_signature(self.X_train, model.predict(self.X_train))
 
+        run_id = None
         try:
             if mlflow.active_run():
                 mlflow.end_run()
-            with mlflow.start_run(run_name='BestModel_Final'):
+            with mlflow.start_run(run_name='BestModel_Final') as run:
                 mlflow.set_tag('model_version', 'final')
                 mlflow.log_params(best_params)
                 mlflow.log_metrics(metrics)
@@ -206,6 +208,9 @@ class RandomForestTrainer:
                 plt.savefig(fi_file)
                 mlflow.log_artifact(fi_file)
                 plt.close()
+
+            # Only hand out the run id once the run was fully logged and closed
+            run_id = run.info.run_id
         except Exception as e:
             print(f'[Erro ao salvar modelo final] {e}')
         finally:
@@ -219,4 +224,4 @@ class RandomForestTrainer:
         ]:
             if os.path.exists(file):
                 os.remove(file)
-        return model, acc, signature
+        return model, acc, signature, run_id
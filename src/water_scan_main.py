@@ -1,7 +1,6 @@
 # main.py
 import os
 
-import mlflow
 from data_pipeline import DataPipeline, DataPreprocessor
 from mlflow_logger import MLFlowLogger
 from model_registry import ModelRegistryManager
@@ -19,8 +18,17 @@ def main():
     - Trains a Random Forest model using Optuna
     - Logs results with MLflow
     - Registers the trained model in the MLflow Registry
+
+    MLflow's HTTP timeout and retries (with backoff) are configured here, once,
+    for every MLflow call of the process; variables already set in the
+    environment take precedence.
     """
 
+    # Configure MLflow's pooled HTTP session (timeout and retries with backoff)
+    os.environ.setdefault('MLFLOW_HTTP_REQUEST_TIMEOUT', '30')
+    os.environ.setdefault('MLFLOW_HTTP_REQUEST_MAX_RETRIES', '3')
+    os.environ.setdefault('MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR', '1')
+
     # Set up experiment in MLflow
     experiment_name = MLFlowLogger.setup_experiment(
         'water_potability_classification_test'
@@ -45,20 +53,30 @@ def main():
         'random_forest', X_train, X_test, y_train, y_test
     )
     study_rf = trainer.run_optuna(n_trials=50)
-    best_model, rf_accuracy, signature = trainer.save_best_model(study_rf.best_params)
+    best_model, rf_accuracy, signature, run_id = trainer.save_best_model(
+        study_rf.best_params
+    )
     print('Accuracy:', rf_accuracy)
     print(classification_report(y_test, best_model.predict(X_test)))
 
     # Register the model in the MLflow Registry (Singleton)
+    if run_id is None:
+        print('Final model run was not logged; skipping registration.')
+        return
+
     registry_manager = ModelRegistryManager()
-    run_id = mlflow.search_runs(order_by=['start_time DESC']).iloc[0].run_id
-    model_uri = f'runs:/{run_id}/random_forest'
-    model_name = 'water_potability_rf'
-    registry_manager.register_and_transition(
-        model_uri=model_uri,
-        model_name=model_name,
-        description='Water potability classification model using Random Forest',
+    outcomes = registry_manager.register_and_transition_many(
+        [
+            {
+                'model_uri': registry_manager.build_model_uri(run_id, 'random_forest'),
+                'model_name': 'water_potability_rf',
+                'description': 'Water potability classification model using Random Forest',
+            },
+        ]
     )
+    for model_name, outcome in outcomes:
+        if isinstance(outcome, Exception):
+            print(f"Registration of model '{model_name}' failed: {outcome}")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,107 @@
+from unittest.mock import MagicMock
+
+import pytest
+from mlflow.exceptions import MlflowException, RestException
+
+from src import model_registry
+from src.model_registry import ModelRegistryManager
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """Fixture with a registry manager whose MLflow calls are mocked"""
+    monkeypatch.setattr(model_registry, 'MlflowClient', MagicMock)
+    model_registry.Singleton._instances.pop(ModelRegistryManager, None)
+    registry = ModelRegistryManager()
+    registry.client.search_model_versions.return_value = []
+    yield registry
+    model_registry.Singleton._instances.pop(ModelRegistryManager, None)
+
+
+def _models(n):
+    return [
+        {
+            'model_uri': f'runs:/{i}/random_forest',
+            'model_name': f'model_{i}',
+            'description': '',
+        }
+        for i in range(n)
+    ]
+
+
+def _not_found():
+    # Shaped like the error returned by the tracking server for an unknown run
+    return RestException(
+        {'error_code': 'RESOURCE_DOES_NOT_EXIST', 'message': 'Run not found'}
+    )
+
+
+def test_build_model_uri():
+    uri = ModelRegistryManager.build_model_uri('abc123')
+    assert uri == 'runs:/abc123/random_forest'
+
+
+def test_register_reuses_version_from_same_run(manager, monkeypatch):
+    created = MagicMock(version='1')
+    register = MagicMock()
+    monkeypatch.setattr(model_registry.mlflow, 'register_model', register)
+    manager.client.search_model_versions.return_value = [created]
+
+    result = manager.register_and_transition('runs:/abc/random_forest', 'model', '')
+    assert result is created
+    register.assert_not_called()
+    search_filter = manager.client.search_model_versions.call_args.args[0]
+    assert "run_id='abc'" in search_filter
+
+
+def test_register_raises_client_error_without_retry(manager, monkeypatch):
+    register = MagicMock(side_effect=_not_found())
+    monkeypatch.setattr(model_registry.mlflow, 'register_model', register)
+
+    with pytest.raises(RestException):
+        manager.register_and_transition('runs:/abc/random_forest', 'model', '')
+    assert register.call_count == 1
+    manager.client.transition_model_version_stage.assert_not_called()
+
+
+def test_register_and_transition_many_keeps_order(manager, monkeypatch):
+    def fake_register(model_uri, name):
+        return MagicMock(version=name[-1])
+
+    monkeypatch.setattr(model_registry.mlflow, 'register_model', fake_register)
+    outcomes = manager.register_and_transition_many(_models(3))
+    assert [name for name, _ in outcomes] == ['model_0', 'model_1', 'model_2']
+    assert [version.version for _, version in outcomes] == ['0', '1', '2']
+    assert manager.client.transition_model_version_stage.call_count == 3
+
+
+def test_register_and_transition_many_reports_partial_failure(manager, monkeypatch):
+    timeout = MlflowException(
+        'API request to http://localhost:5001/api/2.0/mlflow/model-versions/create '
+        'failed with exception ReadTimeout'
+    )
+
+    def fake_register(model_uri, name):
+        if name == 'model_1':
+            raise timeout
+        return MagicMock(version=name[-1])
+
+    monkeypatch.setattr(model_registry.mlflow, 'register_model', fake_register)
+    outcomes = dict(manager.register_and_transition_many(_models(3)))
+
+    assert outcomes['model_1'] is timeout
+    assert outcomes['model_0'].version == '0'
+    assert outcomes['model_2'].version == '2'
+    transitioned = {
+        call.kwargs['name']
+        for call in manager.client.transition_model_version_stage.call_args_list
+    }
+    assert transitioned == {'model_0', 'model_2'}
+
+
+def test_register_and_transition_many_rejects_duplicate_names(manager):
+    models = _models(2)
+    models[1]['model_name'] = 'model_0'
+    with pytest.raises(ValueError):
+        manager.register_and_transition_many(models)
+    manager.client.transition_model_version_stage.assert_not_called()
@@ -1,3 +1,6 @@
+from unittest.mock import MagicMock
+
+from src import model_trainer
 from src.model_trainer import RandomForestTrainer
 
 
@@ -9,3 +12,35 @@ def test_optuna_fake(monkeypatch, dummy_df):
     monkeypatch.setattr(trainer, 'objective', lambda trial: 0.9)
     study = trainer.run_optuna(n_trials=2)
     assert study.best_value == 0.9
+
+
+def _fake_mlflow(monkeypatch, run_id='run-1'):
+    fake = MagicMock()
+    fake.start_run.return_value.__enter__.return_value.info.run_id = run_id
+    monkeypatch.setattr(model_trainer, 'mlflow', fake)
+    return fake
+
+
+def test_save_best_model_returns_run_id(monkeypatch, tmp_path, dummy_df):
+    monkeypatch.chdir(tmp_path)
+    _fake_mlflow(monkeypatch)
+    X = dummy_df.drop(columns=['Potability'])
+    y = dummy_df['Potability']
+    trainer = RandomForestTrainer(X, X, y, y)
+
+    *_, run_id = trainer.save_best_model({'n_estimators': 5})
+    assert run_id == 'run-1'
+
+
+def test_save_best_model_returns_none_when_logging_fails(
+    monkeypatch, tmp_path, dummy_df
+):
+    monkeypatch.chdir(tmp_path)
+    fake = _fake_mlflow(monkeypatch)
+    fake.sklearn.log_model.side_effect = Exception('artifact store down')
+    X = dummy_df.drop(columns=['Potability'])
+    y = dummy_df['Potability']
+    trainer = RandomForestTrainer(X, X, y, y)
+
+    *_, run_id = trainer.save_best_model({'n_estimators': 5})
+    assert run_id is None
@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src import water_scan_main
+
+
+@pytest.fixture
+def pipeline(monkeypatch, dummy_df):
+    """Fixture replacing data loading, training and registry in main with mocks"""
+    # setenv records the original state, so the values main sets are undone
+    for name in ('TIMEOUT', 'MAX_RETRIES', 'BACKOFF_FACTOR'):
+        monkeypatch.setenv(f'MLFLOW_HTTP_REQUEST_{name}', '1')
+    X = dummy_df.drop(columns=['Potability'])
+    y = dummy_df['Potability']
+    monkeypatch.setattr(water_scan_main, 'MLFlowLogger', MagicMock())
+    monkeypatch.setattr(water_scan_main, 'DataPipeline', MagicMock())
+    preprocessor = MagicMock()
+    preprocessor.return_value.split_data.return_value = (X, X, y, y)
+    preprocessor.return_value.apply_smote.return_value = (X, y)
+    monkeypatch.setattr(water_scan_main, 'DataPreprocessor', preprocessor)
+    trainer = MagicMock()
+    model = MagicMock()
+    model.predict.return_value = y
+    trainer.save_best_model.return_value = (model, 0.9, None, 'run-1')
+    factory = MagicMock()
+    factory.create_trainer.return_value = trainer
+    monkeypatch.setattr(water_scan_main, 'TrainerFactory', factory)
+    registry = MagicMock()
+    registry.register_and_transition_many.return_value = []
+    registry.build_model_uri.side_effect = lambda run_id, path: f'runs:/{run_id}/{path}'
+    monkeypatch.setattr(
+        water_scan_main, 'ModelRegistryManager', MagicMock(return_value=registry)
+    )
+    search_runs = MagicMock(side_effect=AssertionError('search_runs called'))
+    monkeypatch.setattr('mlflow.search_runs', search_runs)
+    return trainer, registry, search_runs
+
+
+def test_main_registers_run_from_save_best_model(pipeline):
+    _, registry, search_runs = pipeline
+    water_scan_main.main()
+
+    search_runs.assert_not_called()
+    (models,) = registry.register_and_transition_many.call_args.args
+    assert models[0]['model_uri'] == 'runs:/run-1/random_forest'
+
+
+def test_main_skips_registration_without_run_id(pipeline):
+    trainer, registry, _ = pipeline
+    model, acc, signature, _ = trainer.save_best_model.return_value
+    trainer.save_best_model.return_value = (model, acc, signature, None)
+    water_scan_main.main()
+
+    registry.register_and_transition_many.assert_not_called()